@@ -3,19 +3,10 @@
 
 import os
 from midea_beautiful import appliance_state
+from dotenv import load_dotenv
 
 # Load environment variables from .env file
-def load_env():
-    env_path = os.path.join(os.path.dirname(__file__), '.env')
-    if os.path.exists(env_path):
-        with open(env_path) as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ[key] = value
-
-load_env()
+load_dotenv(os.path.join(os.path.dirname(__file__), '.env'))
 
 # Get credentials from environment
 ip = os.getenv('SENVILLE_IP')
@@ -38,17 +29,28 @@ state = device.state
 print('Fan/Swing/Deflector attributes:')
 print('='*50)
 
-# Check all attributes that might relate to fan direction
-attrs = [a for a in dir(state) if 'swing' in a.lower() or 'fan' in a.lower() or
-         'straight' in a.lower() or 'avoid' in a.lower() or 'deflect' in a.lower()]
-
-for attr in attrs:
-    if not attr.startswith('_') and not callable(getattr(state, attr)):
-        try:
-            value = getattr(state, attr)
-            print(f'  {attr:25} = {value}')
-        except:
-            pass
+# Attributes that might relate to fan direction
+CANDIDATES = (
+    'fan_speed',
+    'vertical_swing',
+    'horizontal_swing',
+    'swing_mode',
+    'fan_direction',
+    'deflector',
+    'avoid_direct_wind',
+    'straight_wind',
+)
+_MISSING = object()
+
+for attr in CANDIDATES:
+    try:
+        value = getattr(state, attr, _MISSING)
+    except Exception:
+        continue
+    if value is _MISSING:
+        print(f'  {attr:25} (not supported)')
+    elif not callable(value):
+        print(f'  {attr:25} = {value}')
 
 print('\nCapabilities related to fan:')
 print('='*50)
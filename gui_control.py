@@ -4,12 +4,24 @@ Senville AC Control - Desktop GUI
 Simple desktop application for controlling your Senville/Midea mini-split AC
 """
 
+# Optional: tkthread makes Tk safe to call from worker threads directly
+try:
+    import tkthread
+    tkthread.patch()
+    TK_THREADSAFE = True
+except ImportError:
+    TK_THREADSAFE = False
+
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import socket
 import sys
 from pathlib import Path
 from datetime import datetime
+import asyncio
+import concurrent.futures
+import queue
 import threading
 import time
 
@@ -19,8 +31,75 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import check moved to after potential venv activation
 # These imports will fail with clear error if libraries missing
 from midea_beautiful import appliance_state
+from midea_beautiful.exceptions import MideaNetworkError
 from dotenv import load_dotenv
 
+# Label fonts, applied through the ttk styles set up in create_widgets
+FONT_TITLE = ('Helvetica', 18, 'bold')
+FONT_BOLD = ('Helvetica', 10, 'bold')
+FONT_NORMAL = ('Helvetica', 10)
+FONT_SMALL = ('Helvetica', 9)
+
+# Device mode number -> status label / combobox value
+MODE_MAP = {1: 'Auto', 2: 'Cool', 3: 'Dry', 4: 'Heat', 5: 'Fan'}
+MODE_REVERSE = {num: name.lower() for num, name in MODE_MAP.items()}
+MODE_TO_NUM = {name: num for num, name in MODE_REVERSE.items()}
+
+# Device fan speed -> status label / combobox value
+FAN_MAP = {20: 'Low', 40: 'Med-Low', 60: 'Medium', 80: 'Med-High', 102: 'Auto'}
+FAN_REVERSE = {**FAN_MAP, 100: 'High'}
+FAN_TO_NUM = {name: num for num, name in FAN_REVERSE.items()}
+
+# Precomputed whole-degree conversions covering every value the AC reports
+C_TO_F = {c: int(c * 9 / 5 + 32) for c in range(0, 50)}
+F_TO_C = {f: int((f - 32) * 5 / 9) for f in range(32, 122)}
+
+
+def c_to_f(celsius):
+    """Convert Celsius to whole-degree Fahrenheit"""
+    fahrenheit = C_TO_F.get(celsius)
+    return fahrenheit if fahrenheit is not None else int(celsius * 9 / 5 + 32)
+
+
+def f_to_c(fahrenheit):
+    """Convert Fahrenheit to whole-degree Celsius"""
+    celsius = F_TO_C.get(fahrenheit)
+    return celsius if celsius is not None else int((fahrenheit - 32) * 5 / 9)
+
+
+# Delay used to collapse rapid control changes into one device command
+DEBOUNCE_MS = 200
+
+# Auto-refresh pacing: poll quickly right after a user command, then back
+# off the longer the device state stays unchanged
+ACTIVE_REFRESH_MS = 1000
+ACTIVE_WINDOW = 10  # seconds after a command to keep polling quickly
+MAX_REFRESH_MS = 60000
+
+# Seconds to wait before each reconnect attempt after a network error
+# (one initial attempt plus one retry per delay, 3 attempts in total)
+RETRY_DELAYS = (0.25, 0.75)
+
+# Quick TCP probe of the AC's LAN port before each command, so a dropped
+# network fails fast instead of waiting out the library's socket timeout
+DEVICE_PORT = 6444
+PROBE_TIMEOUT = 0.5  # seconds
+PROBE_CACHE_SECONDS = 2
+
+# Pending-change key -> (device state attribute, human-readable name)
+PENDING_FIELDS = {
+    'power': ('running', 'power'),
+    'mode': ('mode', 'mode'),
+    'temp': ('target_temperature', 'temperature'),
+    'fan': ('fan_speed', 'fan speed'),
+    'vswing': ('vertical_swing', 'vertical swing'),
+    'hswing': ('horizontal_swing', 'horizontal swing'),
+}
+
+
+class DeviceUnreachable(Exception):
+    """The AC did not accept a connection on DEVICE_PORT"""
+
 
 class SenvilleGUI:
     """Main GUI application for Senville AC control"""
@@ -37,11 +116,31 @@ class SenvilleGUI:
         # State variables
         self.device = None
         self.current_state = None
+        self._last_snapshot = None  # Last state shown by update_status_display
+        self._probe_cache = (float('-inf'), False)  # (time.monotonic(), reachable)
         self.auto_refresh = tk.BooleanVar(value=True)
-        self.refresh_interval = 5  # seconds
-        self.refresh_thread = None
-        self.running = True
+        self.refresh_interval = 5  # seconds, base idle interval
+        self._idle_ticks = 0  # Consecutive refreshes with no state change
+        self._last_action = 0.0  # time.monotonic() of the last user command
+        self._refresh_after_id = None
+        self._refresh_future = None  # Future of the in-flight refresh, if any
         self.temp_slider_active = False  # Track if user is adjusting slider
+        self._unit_cached = "F"  # Mirrors temp_unit; refreshed in update_temp_scale
+
+        # Control changes waiting to be sent (see queue_change)
+        self._pending = {}
+        self._flush_after_id = None
+
+        # Device I/O runs as coroutines on an asyncio loop in one background
+        # thread. The library is synchronous, so its calls are handed to a
+        # single daemon I/O thread (see run_io), which keeps device access
+        # serialized and never holds up interpreter exit.
+        self._loop = asyncio.new_event_loop()
+        self._io_q = queue.Queue()
+        self._io_thread = threading.Thread(target=self._io_worker, daemon=True)
+        self._io_thread.start()
+        self._loop_thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._loop_thread.start()
 
         # Create GUI
         self.create_widgets()
@@ -86,6 +185,13 @@ class SenvilleGUI:
     def create_widgets(self):
         """Create all GUI widgets"""
 
+        # Named label styles so Tk resolves each font once
+        style = ttk.Style()
+        style.configure('Title.TLabel', font=FONT_TITLE)
+        style.configure('Bold.TLabel', font=FONT_BOLD)
+        style.configure('Normal.TLabel', font=FONT_NORMAL)
+        style.configure('Small.TLabel', font=FONT_SMALL)
+
         # Main container with padding
         main_frame = ttk.Frame(self.root, padding="10")
         main_frame.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
@@ -94,7 +200,7 @@ class SenvilleGUI:
         title_label = ttk.Label(
             main_frame,
             text="Senville AC Control",
-            font=('Helvetica', 18, 'bold')
+            style='Title.TLabel'
         )
         title_label.grid(row=0, column=0, columnspan=2, pady=(0, 10))
 
@@ -102,7 +208,7 @@ class SenvilleGUI:
         device_label = ttk.Label(
             main_frame,
             text=f"Device: {self.ip}",
-            font=('Helvetica', 10)
+            style='Normal.TLabel'
         )
         device_label.grid(row=1, column=0, columnspan=2, pady=(0, 20))
 
@@ -143,18 +249,18 @@ class SenvilleGUI:
         ]
 
         for idx, (key, label) in enumerate(status_items):
-            ttk.Label(status_frame, text=label, font=('Helvetica', 10, 'bold')).grid(
+            ttk.Label(status_frame, text=label, style='Bold.TLabel').grid(
                 row=idx, column=0, sticky=tk.W, padx=(0, 10), pady=3
             )
-            value_label = ttk.Label(status_frame, text="--", font=('Helvetica', 10))
+            value_label = ttk.Label(status_frame, text="--", style='Normal.TLabel')
             value_label.grid(row=idx, column=1, sticky=tk.W, pady=3)
             self.status_labels[key] = value_label
 
         # Last updated
-        ttk.Label(status_frame, text="Last Updated:", font=('Helvetica', 9)).grid(
+        ttk.Label(status_frame, text="Last Updated:", style='Small.TLabel').grid(
             row=len(status_items), column=0, sticky=tk.W, padx=(0, 10), pady=(10, 0)
         )
-        self.last_updated_label = ttk.Label(status_frame, text="--", font=('Helvetica', 9))
+        self.last_updated_label = ttk.Label(status_frame, text="--", style='Small.TLabel')
         self.last_updated_label.grid(row=len(status_items), column=1, sticky=tk.W, pady=(10, 0))
 
     def create_controls_frame(self, parent):
@@ -163,7 +269,7 @@ class SenvilleGUI:
         controls_frame.grid(row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 20))
 
         # Power control
-        ttk.Label(controls_frame, text="Power:", font=('Helvetica', 10, 'bold')).grid(
+        ttk.Label(controls_frame, text="Power:", style='Bold.TLabel').grid(
             row=0, column=0, sticky=tk.W, padx=(0, 10), pady=5
         )
         power_frame = ttk.Frame(controls_frame)
@@ -173,7 +279,7 @@ class SenvilleGUI:
         ttk.Button(power_frame, text="OFF", command=lambda: self.set_power(False), width=8).pack(side=tk.LEFT)
 
         # Mode control
-        ttk.Label(controls_frame, text="Mode:", font=('Helvetica', 10, 'bold')).grid(
+        ttk.Label(controls_frame, text="Mode:", style='Bold.TLabel').grid(
             row=1, column=0, sticky=tk.W, padx=(0, 10), pady=5
         )
         self.mode_var = tk.StringVar(value="auto")
@@ -185,10 +291,10 @@ class SenvilleGUI:
             width=15
         )
         mode_combo.grid(row=1, column=1, sticky=tk.W, pady=5)
-        mode_combo.bind('<<ComboboxSelected>>', lambda e: self.set_mode())
+        mode_combo.bind('<<ComboboxSelected>>', self.set_mode)
 
         # Temperature control
-        ttk.Label(controls_frame, text="Temperature:", font=('Helvetica', 10, 'bold')).grid(
+        ttk.Label(controls_frame, text="Temperature:", style='Bold.TLabel').grid(
             row=2, column=0, sticky=tk.W, padx=(0, 10), pady=5
         )
 
@@ -211,7 +317,7 @@ class SenvilleGUI:
         self.temp_scale.bind("<ButtonPress-1>", self.on_temp_press)
         self.temp_scale.bind("<ButtonRelease-1>", self.on_temp_release)
 
-        self.temp_label = ttk.Label(temp_frame, text="72°F", font=('Helvetica', 10, 'bold'))
+        self.temp_label = ttk.Label(temp_frame, text="72°F", style='Bold.TLabel')
         self.temp_label.pack(side=tk.LEFT, padx=(10, 0))
 
         # Unit toggle
@@ -232,7 +338,7 @@ class SenvilleGUI:
         ).pack(side=tk.LEFT)
 
         # Fan speed control
-        ttk.Label(controls_frame, text="Fan Speed:", font=('Helvetica', 10, 'bold')).grid(
+        ttk.Label(controls_frame, text="Fan Speed:", style='Bold.TLabel').grid(
             row=3, column=0, sticky=tk.W, padx=(0, 10), pady=5
         )
         self.fan_var = tk.StringVar(value="Auto")
@@ -244,10 +350,10 @@ class SenvilleGUI:
             width=15
         )
         fan_combo.grid(row=3, column=1, sticky=tk.W, pady=5)
-        fan_combo.bind('<<ComboboxSelected>>', lambda e: self.set_fan_speed())
+        fan_combo.bind('<<ComboboxSelected>>', self.set_fan_speed)
 
         # Swing controls
-        ttk.Label(controls_frame, text="Vertical Swing:", font=('Helvetica', 10, 'bold')).grid(
+        ttk.Label(controls_frame, text="Vertical Swing:", style='Bold.TLabel').grid(
             row=4, column=0, sticky=tk.W, padx=(0, 10), pady=5
         )
         self.vswing_var = tk.BooleanVar(value=False)
@@ -258,7 +364,7 @@ class SenvilleGUI:
             command=self.set_vswing
         ).grid(row=4, column=1, sticky=tk.W, pady=5)
 
-        ttk.Label(controls_frame, text="Horizontal Swing:", font=('Helvetica', 10, 'bold')).grid(
+        ttk.Label(controls_frame, text="Horizontal Swing:", style='Bold.TLabel').grid(
             row=5, column=0, sticky=tk.W, padx=(0, 10), pady=5
         )
         self.hswing_var = tk.BooleanVar(value=False)
@@ -283,7 +389,7 @@ class SenvilleGUI:
 
         ttk.Checkbutton(
             button_frame,
-            text="Auto-refresh (5s)",
+            text="Auto-refresh",
             variable=self.auto_refresh,
             command=self.toggle_auto_refresh
         ).pack(side=tk.LEFT, padx=5)
@@ -291,29 +397,39 @@ class SenvilleGUI:
     def update_temp_scale(self):
         """Update temperature scale for F/C"""
         current_temp = self.temp_var.get()
+        self._unit_cached = self.temp_unit.get()
 
-        if self.temp_unit.get() == "C":
+        if self._unit_cached == "C":
             # Switch to Celsius
             self.temp_scale.configure(from_=16, to=31)
             # Convert F to C
             if current_temp > 31:  # Was in F
-                current_temp = int((current_temp - 32) * 5 / 9)
+                current_temp = f_to_c(current_temp)
             self.temp_var.set(current_temp)
         else:
             # Switch to Fahrenheit
             self.temp_scale.configure(from_=60, to=87)
             # Convert C to F
             if current_temp < 60:  # Was in C
-                current_temp = int(current_temp * 9 / 5 + 32)
+                current_temp = c_to_f(current_temp)
             self.temp_var.set(current_temp)
 
         self.on_temp_change(None)
 
+        # Redraw the status temperatures in the new unit right away rather
+        # than on the next (possibly backed-off) refresh
+        if self.current_state is not None:
+            self.update_status_display(self.current_state)
+
     def on_temp_change(self, value):
-        """Handle temperature slider change (just update label)"""
-        temp = self.temp_var.get()
-        unit = self.temp_unit.get()
-        self.temp_label.config(text=f"{temp}°{unit}")
+        """Handle temperature slider change (just update label)
+
+        Called for every step of a slider drag, so it uses the value Tk
+        passes in and the unit cached by update_temp_scale.
+        """
+        if value is None:
+            value = self.temp_var.get()
+        self.temp_label.config(text=f"{value}°{self._unit_cached}")
 
     def on_temp_press(self, event):
         """Handle temperature slider press (start dragging)"""
@@ -324,152 +440,295 @@ class SenvilleGUI:
         self.temp_slider_active = False
         self.set_temperature()
 
+    def _run_loop(self):
+        """Run the device I/O event loop until on_closing stops it"""
+        asyncio.set_event_loop(self._loop)
+        # Held by each flush for its whole apply, retries included, so an
+        # older change cannot be re-sent on top of a newer one
+        self._apply_lock = asyncio.Lock()
+        self._loop.run_forever()
+
+        # Cancel whatever was still pending so closing the loop is quiet
+        tasks = asyncio.all_tasks(self._loop)
+        for task in tasks:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self._loop.close()
+
+    def _io_worker(self):
+        """Run blocking device calls one at a time until a None sentinel"""
+        while True:
+            job = self._io_q.get()
+            if job is None:
+                break
+            future, fn, args = job
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    async def run_io(self, fn, *args):
+        """Await fn(*args) run on the I/O thread"""
+        future = concurrent.futures.Future()
+        self._io_q.put((future, fn, args))
+        return await asyncio.wrap_future(future, loop=self._loop)
+
+    def _stop_io(self):
+        """Cancel queued device calls and let the I/O thread exit"""
+        while True:
+            try:
+                job = self._io_q.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                job[0].cancel()
+        self._io_q.put(None)
+
+    def submit(self, coro):
+        """Schedule a device coroutine on the I/O event loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def call_ui(self, fn, *args):
+        """Run a UI update from the I/O thread
+
+        With tkthread installed the call is made directly; otherwise it is
+        handed to the Tk event loop with root.after.
+        """
+        if TK_THREADSAFE:
+            fn(*args)
+        else:
+            self.post_ui(fn, *args)
+
+    def post_ui(self, fn, *args):
+        """Queue a call on the Tk event loop without waiting for it
+
+        Used, even when tkthread is installed, for calls that must not
+        hold up the I/O thread (modal dialogs) and for callbacks that own
+        Tk-thread state (update_status_display, _invalidate_snapshot).
+        """
+        self.root.after(0, fn, *args)
+
+    def show_error(self, title, message):
+        """Show an error dialog from the I/O thread without blocking it"""
+        self.post_ui(messagebox.showerror, title, message)
+
     def get_device(self):
         """Get or create device connection"""
+        if self.device is None:
+            self.device = appliance_state(
+                address=self.ip,
+                token=self.token,
+                key=self.key
+            )
+        return self.device
+
+    def is_reachable(self, fresh=False):
+        """Probe the AC's LAN port, caching the answer for PROBE_CACHE_SECONDS
+
+        fresh=True ignores any cached answer.
+        """
+        now = time.monotonic()
+        checked_at, reachable = self._probe_cache
+        if not fresh and now - checked_at < PROBE_CACHE_SECONDS:
+            return reachable
+
         try:
-            if self.device is None:
-                self.device = appliance_state(
-                    address=self.ip,
-                    token=self.token,
-                    key=self.key
-                )
-            return self.device
-        except Exception as e:
-            messagebox.showerror("Connection Error", f"Failed to connect to device:\n{str(e)}")
-            return None
+            with socket.create_connection((self.ip, DEVICE_PORT), timeout=PROBE_TIMEOUT):
+                reachable = True
+        except OSError:
+            reachable = False
+
+        self._probe_cache = (now, reachable)
+        return reachable
+
+    async def check_reachable(self, fresh=False):
+        """Raise DeviceUnreachable if the port probe fails"""
+        if not await self.run_io(self.is_reachable, fresh):
+            raise DeviceUnreachable(f"AC not reachable at {self.ip}")
+
+    async def call_device(self, action):
+        """Run action(device) on the I/O thread, reconnecting on failure
+
+        Network errors drop the cached connection and retry after each of
+        RETRY_DELAYS. Any other error also drops it before propagating, so
+        the next command starts from a fresh connection.
+
+        Raises DeviceUnreachable without touching the device if the port
+        probe fails, either up front or freshly re-run before a retry.
+        """
+        await self.check_reachable()
+
+        attempts = len(RETRY_DELAYS) + 1
+        for attempt in range(attempts):
+            try:
+                return await self.run_io(lambda: action(self.get_device()))
+            except (OSError, MideaNetworkError):
+                self.device = None
+                if attempt == attempts - 1:
+                    raise
+                await asyncio.sleep(RETRY_DELAYS[attempt])
+                # Stop early if the link has dropped rather than waiting out
+                # another socket timeout
+                await self.check_reachable(fresh=True)
+            except Exception:
+                self.device = None
+                raise
 
     def refresh_status(self):
-        """Refresh device status"""
+        """Refresh device status
+
+        Skipped while a previous refresh is still in flight, so a slow AC
+        cannot build up a backlog of refreshes ahead of user commands.
+        """
+        if self._refresh_future is not None and not self._refresh_future.done():
+            return
+
         self.update_status_bar("Refreshing status...")
 
-        def refresh_thread():
+        def fetch(device):
+            # One round-trip fetches every status field
+            device.refresh()
+            return device.state
+
+        async def refresh_async():
             try:
-                device = self.get_device()
-                if device:
-                    state = device.state
-                    self.current_state = state
+                state = await self.call_device(fetch)
+                self.current_state = state
 
-                    # Update UI in main thread
-                    self.root.after(0, self.update_status_display, state)
+                # Always on the Tk thread: it owns _last_snapshot
+                self.post_ui(self.update_status_display, state)
             except Exception as e:
-                self.root.after(0, self.update_status_bar, f"Error: {str(e)}")
+                self.call_ui(self.update_status_bar, f"Error: {str(e)}")
 
-        threading.Thread(target=refresh_thread, daemon=True).start()
+        self._refresh_future = self.submit(refresh_async())
 
     def update_status_display(self, state):
-        """Update status display with device state"""
+        """Update status display with device state
+
+        Only widgets whose underlying value changed since the previous
+        refresh are reconfigured. Runs only on the Tk thread, which owns
+        _last_snapshot.
+        """
         try:
-            # Power
-            power_text = "ON" if state.running else "OFF"
-            self.status_labels['power'].config(
-                text=power_text,
-                foreground='green' if state.running else 'red'
+            # Snapshot every field once; everything below works on locals
+            running, mode, target_temp, indoor_temp, fan_speed, vswing, hswing = (
+                state.running, state.mode, state.target_temperature,
+                state.indoor_temperature, state.fan_speed,
+                state.vertical_swing, state.horizontal_swing
             )
+            temp_unit = self._unit_cached
+            snap = (running, mode, target_temp, indoor_temp, fan_speed, vswing, hswing, temp_unit)
+
+            # Last updated
+            now = datetime.now().strftime("%H:%M:%S")
+            self.last_updated_label.config(text=now)
+
+            last = self._last_snapshot
+            if snap == last:
+                self._idle_ticks += 1
+                self.update_status_bar("Status updated")
+                return
+            self._last_snapshot = snap
+            self._idle_ticks = 0
+
+            def changed(*fields):
+                return last is None or any(last[i] != snap[i] for i in fields)
+
+            # Power
+            if changed(0):
+                power_text = "ON" if running else "OFF"
+                self.status_labels['power'].config(
+                    text=power_text,
+                    foreground='green' if running else 'red'
+                )
 
             # Mode
-            mode_map = {1: 'Auto', 2: 'Cool', 3: 'Dry', 4: 'Heat', 5: 'Fan'}
-            mode_reverse = {1: 'auto', 2: 'cool', 3: 'dry', 4: 'heat', 5: 'fan'}
-            mode_text = mode_map.get(state.mode, f"Unknown ({state.mode})")
-            self.status_labels['mode'].config(text=mode_text)
+            if changed(1):
+                mode_text = MODE_MAP.get(mode)
+                if mode_text is None:
+                    mode_text = f"Unknown ({mode})"
+                self.status_labels['mode'].config(text=mode_text)
 
-            # Update mode control to match current state
-            if state.mode in mode_reverse:
-                self.mode_var.set(mode_reverse[state.mode])
+                # Update mode control to match current state
+                if mode in MODE_REVERSE:
+                    self.mode_var.set(MODE_REVERSE[mode])
 
             # Temperatures
-            target_temp = state.target_temperature
-            indoor_temp = state.indoor_temperature
-
-            if self.temp_unit.get() == "F":
-                target_temp = int(target_temp * 9 / 5 + 32)
-                indoor_temp = int(indoor_temp * 9 / 5 + 32)
+            if temp_unit == "F":
+                target_temp = c_to_f(target_temp)
+                indoor_temp = c_to_f(indoor_temp)
                 unit = "°F"
             else:
                 unit = "°C"
 
-            self.status_labels['target_temp'].config(text=f"{target_temp}{unit}")
-            self.status_labels['indoor_temp'].config(text=f"{indoor_temp}{unit}")
+            if changed(2, 7):
+                self.status_labels['target_temp'].config(text=f"{target_temp}{unit}")
 
-            # Update temperature control to match current state (only if not being adjusted)
-            if not self.temp_slider_active:
-                self.temp_var.set(target_temp)
-                self.temp_label.config(text=f"{target_temp}°{self.temp_unit.get()}")
+                # Update temperature control to match current state (only if not being adjusted)
+                if not self.temp_slider_active:
+                    self.temp_var.set(target_temp)
+                    self.temp_label.config(text=f"{target_temp}°{temp_unit}")
+
+            if changed(3, 7):
+                self.status_labels['indoor_temp'].config(text=f"{indoor_temp}{unit}")
 
             # Fan speed
-            fan_map = {20: 'Low', 40: 'Med-Low', 60: 'Medium', 80: 'Med-High', 102: 'Auto'}
-            fan_reverse = {20: 'Low', 40: 'Med-Low', 60: 'Medium', 80: 'Med-High', 102: 'Auto', 100: 'High'}
-            fan_text = fan_map.get(state.fan_speed, f"{state.fan_speed}")
-            self.status_labels['fan_speed'].config(text=fan_text)
+            if changed(4):
+                fan_text = FAN_MAP.get(fan_speed)
+                if fan_text is None:
+                    fan_text = str(fan_speed)
+                self.status_labels['fan_speed'].config(text=fan_text)
 
-            # Update fan control to match current state
-            if state.fan_speed in fan_reverse:
-                self.fan_var.set(fan_reverse[state.fan_speed])
+                # Update fan control to match current state
+                fan_name = FAN_REVERSE.get(fan_speed)
+                if fan_name is not None:
+                    self.fan_var.set(fan_name)
 
             # Swing
-            self.status_labels['vswing'].config(
-                text="ON" if state.vertical_swing else "OFF"
-            )
-            self.status_labels['hswing'].config(
-                text="ON" if state.horizontal_swing else "OFF"
-            )
-
-            # Update swing controls to match current state
-            self.vswing_var.set(state.vertical_swing)
-            self.hswing_var.set(state.horizontal_swing)
-
-            # Last updated
-            now = datetime.now().strftime("%H:%M:%S")
-            self.last_updated_label.config(text=now)
+            if changed(5):
+                self.status_labels['vswing'].config(
+                    text="ON" if vswing else "OFF"
+                )
+                self.vswing_var.set(vswing)
+            if changed(6):
+                self.status_labels['hswing'].config(
+                    text="ON" if hswing else "OFF"
+                )
+                self.hswing_var.set(hswing)
 
             self.update_status_bar("Status updated")
 
         except Exception as e:
+            self._last_snapshot = None
             self.update_status_bar(f"Error updating display: {str(e)}")
 
+    def _invalidate_snapshot(self):
+        """Make the next update_status_display redraw every widget
+
+        Like update_status_display, only call this on the Tk thread.
+        """
+        self._last_snapshot = None
+
     def update_status_bar(self, message):
         """Update status bar message"""
         self.status_bar.config(text=message)
 
     def set_power(self, power_on):
         """Set power state"""
-        self.update_status_bar(f"Turning {'ON' if power_on else 'OFF'}...")
-
-        def power_thread():
-            try:
-                device = self.get_device()
-                if device:
-                    device.state.running = power_on
-                    device.apply()
-                    self.root.after(1000, self.refresh_status)
-                    self.root.after(0, self.update_status_bar,
-                                  f"Power {'ON' if power_on else 'OFF'}")
-            except Exception as e:
-                self.root.after(0, messagebox.showerror, "Error",
-                              f"Failed to set power:\n{str(e)}")
+        self.queue_change('power', power_on,
+                          f"Turning {'ON' if power_on else 'OFF'}...",
+                          f"Power {'ON' if power_on else 'OFF'}")
 
-        threading.Thread(target=power_thread, daemon=True).start()
-
-    def set_mode(self):
+    def set_mode(self, event=None):
         """Set operating mode"""
         mode = self.mode_var.get()
-        mode_map = {'auto': 1, 'cool': 2, 'dry': 3, 'heat': 4, 'fan': 5}
-        mode_num = mode_map.get(mode, 1)
-
-        self.update_status_bar(f"Setting mode to {mode}...")
-
-        def mode_thread():
-            try:
-                device = self.get_device()
-                if device:
-                    device.state.mode = mode_num
-                    device.apply()
-                    self.root.after(1000, self.refresh_status)
-                    self.root.after(0, self.update_status_bar, f"Mode set to {mode}")
-            except Exception as e:
-                self.root.after(0, messagebox.showerror, "Error",
-                              f"Failed to set mode:\n{str(e)}")
+        mode_num = MODE_TO_NUM.get(mode, 1)
 
-        threading.Thread(target=mode_thread, daemon=True).start()
+        self.queue_change('mode', mode_num,
+                          f"Setting mode to {mode}...",
+                          f"Mode set to {mode}")
 
     def set_temperature(self):
         """Set target temperature"""
@@ -477,109 +736,142 @@ class SenvilleGUI:
         unit = self.temp_unit.get()
 
         # Convert to Celsius for device
-        temp_c = temp if unit == "C" else int((temp - 32) * 5 / 9)
-
-        self.update_status_bar(f"Setting temperature to {temp}°{unit}...")
+        temp_c = temp if unit == "C" else f_to_c(temp)
 
-        def temp_thread():
-            try:
-                device = self.get_device()
-                if device:
-                    device.state.target_temperature = temp_c
-                    device.apply()
-                    self.root.after(1000, self.refresh_status)
-                    self.root.after(0, self.update_status_bar,
-                                  f"Temperature set to {temp}°{unit}")
-            except Exception as e:
-                self.root.after(0, messagebox.showerror, "Error",
-                              f"Failed to set temperature:\n{str(e)}")
-
-        threading.Thread(target=temp_thread, daemon=True).start()
+        self.queue_change('temp', temp_c,
+                          f"Setting temperature to {temp}°{unit}...",
+                          f"Temperature set to {temp}°{unit}")
 
-    def set_fan_speed(self):
+    def set_fan_speed(self, event=None):
         """Set fan speed"""
         fan = self.fan_var.get()
-        fan_map = {
-            'Auto': 102, 'Low': 20, 'Med-Low': 40,
-            'Medium': 60, 'Med-High': 80, 'High': 100
-        }
-        fan_speed = fan_map.get(fan, 102)
+        fan_speed = FAN_TO_NUM.get(fan, 102)
 
-        self.update_status_bar(f"Setting fan speed to {fan}...")
-
-        def fan_thread():
-            try:
-                device = self.get_device()
-                if device:
-                    device.state.fan_speed = fan_speed
-                    device.apply()
-                    self.root.after(1000, self.refresh_status)
-                    self.root.after(0, self.update_status_bar, f"Fan speed set to {fan}")
-            except Exception as e:
-                self.root.after(0, messagebox.showerror, "Error",
-                              f"Failed to set fan speed:\n{str(e)}")
-
-        threading.Thread(target=fan_thread, daemon=True).start()
+        self.queue_change('fan', fan_speed,
+                          f"Setting fan speed to {fan}...",
+                          f"Fan speed set to {fan}")
 
     def set_vswing(self):
         """Set vertical swing"""
         enabled = self.vswing_var.get()
-
-        def swing_thread():
-            try:
-                device = self.get_device()
-                if device:
-                    device.state.vertical_swing = enabled
-                    device.apply()
-                    self.root.after(1000, self.refresh_status)
-                    self.root.after(0, self.update_status_bar,
-                                  f"Vertical swing {'enabled' if enabled else 'disabled'}")
-            except Exception as e:
-                self.root.after(0, messagebox.showerror, "Error",
-                              f"Failed to set vertical swing:\n{str(e)}")
-
-        threading.Thread(target=swing_thread, daemon=True).start()
+        self.queue_change('vswing', enabled,
+                          f"{'Enabling' if enabled else 'Disabling'} vertical swing...",
+                          f"Vertical swing {'enabled' if enabled else 'disabled'}")
 
     def set_hswing(self):
         """Set horizontal swing"""
         enabled = self.hswing_var.get()
-
-        def swing_thread():
+        self.queue_change('hswing', enabled,
+                          f"{'Enabling' if enabled else 'Disabling'} horizontal swing...",
+                          f"Horizontal swing {'enabled' if enabled else 'disabled'}")
+
+    def queue_change(self, field, value, pending_message, done_message):
+        """Record a desired setting and (re)start the debounce timer
+
+        Changes made within DEBOUNCE_MS of each other are collapsed into a
+        single device.apply() carrying the latest value of every field.
+        """
+        self._pending[field] = (value, done_message)
+        self.update_status_bar(pending_message)
+
+        # Poll quickly for a while so the display follows the change
+        self._idle_ticks = 0
+        self._last_action = time.monotonic()
+        if self.auto_refresh.get():
+            self.start_auto_refresh()
+
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+        self._flush_after_id = self.root.after(DEBOUNCE_MS, self._flush_pending)
+
+    def _flush_pending(self):
+        """Send all pending changes to the device in one apply()"""
+        self._flush_after_id = None
+        if not self._pending:
+            return
+
+        pending, self._pending = self._pending, {}
+
+        # Auto-refresh already polls quickly after a command; only schedule
+        # a follow-up refresh when it is turned off
+        refresh_after = not self.auto_refresh.get()
+
+        # Every field is written to the one device.state and sent in a single
+        # apply(); the appliance has no independent per-field commands, so
+        # there is nothing to overlap, and concurrent writers would race on
+        # the shared state and connection.
+        def apply(device):
+            for field, (value, _) in pending.items():
+                setattr(device.state, PENDING_FIELDS[field][0], value)
+            device.apply()
+
+        async def flush_async():
             try:
-                device = self.get_device()
-                if device:
-                    device.state.horizontal_swing = enabled
-                    device.apply()
-                    self.root.after(1000, self.refresh_status)
-                    self.root.after(0, self.update_status_bar,
-                                  f"Horizontal swing {'enabled' if enabled else 'disabled'}")
+                async with self._apply_lock:
+                    await self.call_device(apply)
+                # The device may round or ignore a setting; resync every
+                # control on the next refresh even if its state is unchanged
+                self.post_ui(self._invalidate_snapshot)
+                if refresh_after:
+                    self.call_ui(self.root.after, 1000, self.refresh_status)
+                self.call_ui(self.update_status_bar,
+                             "; ".join(msg for _, msg in pending.values()))
+            except DeviceUnreachable as e:
+                self.post_ui(self._invalidate_snapshot)
+                self.call_ui(self.update_status_bar, f"Not sent: {str(e)}")
             except Exception as e:
-                self.root.after(0, messagebox.showerror, "Error",
-                              f"Failed to set horizontal swing:\n{str(e)}")
+                # Controls may no longer match the device; redraw everything next time
+                self.post_ui(self._invalidate_snapshot)
+                names = ", ".join(PENDING_FIELDS[field][1] for field in pending)
+                self.show_error("Error", f"Failed to set {names}:\n{str(e)}")
 
-        threading.Thread(target=swing_thread, daemon=True).start()
+        self.submit(flush_async())
 
-    def start_auto_refresh(self):
-        """Start auto-refresh thread"""
-        def auto_refresh_loop():
-            while self.running:
-                if self.auto_refresh.get():
-                    self.root.after(0, self.refresh_status)
-                time.sleep(self.refresh_interval)
+    def next_refresh_interval(self):
+        """Milliseconds until the next auto-refresh
+
+        1 s for ACTIVE_WINDOW seconds after a user command, otherwise the
+        base interval stretched by one step for every three unchanged
+        refreshes, capped at MAX_REFRESH_MS.
+        """
+        if time.monotonic() - self._last_action < ACTIVE_WINDOW:
+            return ACTIVE_REFRESH_MS
+        return min(MAX_REFRESH_MS, self.refresh_interval * 1000 * (1 + self._idle_ticks // 3))
 
-        self.refresh_thread = threading.Thread(target=auto_refresh_loop, daemon=True)
-        self.refresh_thread.start()
+    def start_auto_refresh(self):
+        """Schedule the next auto-refresh tick on the Tk event loop"""
+        self.stop_auto_refresh()
+        self._refresh_after_id = self.root.after(self.next_refresh_interval(), self._tick)
+
+    def stop_auto_refresh(self):
+        """Cancel any scheduled auto-refresh tick"""
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+            self._refresh_after_id = None
+
+    def _tick(self):
+        """Refresh status and reschedule while auto-refresh is enabled"""
+        self._refresh_after_id = None
+        if self.auto_refresh.get():
+            self.refresh_status()
+            self.start_auto_refresh()
 
     def toggle_auto_refresh(self):
         """Toggle auto-refresh"""
         if self.auto_refresh.get():
+            self.start_auto_refresh()
             self.update_status_bar("Auto-refresh enabled")
         else:
+            self.stop_auto_refresh()
             self.update_status_bar("Auto-refresh disabled")
 
     def on_closing(self):
         """Handle window close"""
-        self.running = False
+        self.stop_auto_refresh()
+        if self._flush_after_id is not None:
+            self.root.after_cancel(self._flush_after_id)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._stop_io()
         self.root.destroy()
 
 